@@ -4,13 +4,25 @@ import configparser
 import logging
 import os
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from typing import List, Callable, Dict, Union, Tuple, Any, Set
+from typing import List, Callable, Dict, Union, Tuple, Any, Set, Iterable
+
+from config_utils._fastini import DEFAULTSECT, FastConfigParser
 
 LOGGER = logging.getLogger('config_utils')
 
+# sentinel marking a processor result that has not been computed yet
+_MISSING = object()
+
+# parsed INI files shared across IniConfigReader instances, keyed by the
+# file's identity and change signature; an edited file gets a new key and
+# the stale entry simply stops being hit
+_INI_CACHE: Dict[Tuple[str, int, int], FastConfigParser] = {}
+
 
 class BaseOption(ABC):
+    # empty so that slotted subclasses do not grow a __dict__ through us
+    __slots__ = ()
+
     def __hash__(self):
         return hash((self.name, self.section))
 
@@ -22,6 +34,10 @@ class BaseOption(ABC):
 
 
 class Option(BaseOption):
+    # one instance per config key, often held in sets/dicts - slots keep
+    # them small and make attribute reads a fixed-offset load
+    __slots__ = ('name', 'section', '_processor', '_default', '_value',
+                 'description', '_hash', '_value_cached', '_default_cached')
 
     def __init__(
             self,
@@ -38,27 +54,61 @@ class Option(BaseOption):
         self.section = section
         self._value = value
         self.description = description
+        self._value_cached = _MISSING
+        self._default_cached = _MISSING
+        # options are hash-immutable: name and section never change after
+        # construction, so the hash is computed once
+        self._hash = hash((name, section))
+
+    def __hash__(self):
+        return self._hash
 
     @property
     def value(self):
-        if self._value:
-            return self._processor(self._value)
+        if self._value_cached is _MISSING:
+            self._value_cached = self._processor(self._value) if self._value is not None else None
+        return self._value_cached
 
     @property
     def default(self):
-        if self._default:
-            return self._processor(self._default)
+        if self._default_cached is _MISSING:
+            self._default_cached = self._processor(self._default) if self._default is not None else None
+        return self._default_cached
+
+    # drop the memoized processor results, e.g. after swapping _processor
+    def reset_cache(self):
+        self._value_cached = _MISSING
+        self._default_cached = _MISSING
 
 
 class BoundOption(BaseOption):
+    __slots__ = ('_option', '_reader', 'name', 'section', '_hash')
+
     def __init__(self,
                  config_option: Option,
                  reader: BaseConfig
                  ):
         self._option = config_option
         self._reader = reader
+        # hot attributes live on the instance / as properties so the
+        # __getattr__ fallback is never hit for them
+        self.name = config_option.name
+        self.section = config_option.section
+        self._hash = config_option._hash
+
+    def __hash__(self):
+        return self._hash
+
+    @property
+    def value(self):
+        return self._option.value
+
+    @property
+    def default(self):
+        return self._option.default
 
     def __getattr__(self, name):
+        # safety net for the rarely read attributes (description, ...)
         return self._option.__getattribute__(name)
 
     def resolve(self):
@@ -71,24 +121,27 @@ class BaseConfig(ABC):
         self.readers = readers or []
         self._options = set(options or [])
 
-    def get_flat(self) -> Union[Set, List]:
-        if isinstance(self, BaseConfigReader):
-            return set(), [self]
+    def get_flat(self) -> Tuple[Set, List]:
+        options: Set[Option] = set()
+        readers: List[BaseConfig] = []
+        self._get_flat_into(options, readers)
+        return options, readers
 
-        readers = []
-        options = self._options
+    # single-pass accumulation: each node adds into the shared containers
+    # instead of building and unioning a new set per level
+    def _get_flat_into(self, options_out: Set[Option], readers_out: List[BaseConfig]):
+        if isinstance(self, BaseConfigReader):
+            readers_out.append(self)
+            return
 
+        options_out |= self._options
         for reader in self.readers:
-            new_options, new_readers = reader.get_flat()
-            readers += new_readers
-            options |= new_options
-
-        return options, readers
+            reader._get_flat_into(options_out, readers_out)
 
     def flatten(self):
-        readers, options = self.get_flat()
-        self.readers = readers
+        options, readers = self.get_flat()
         self._options = options
+        self.readers = readers
 
     @abstractmethod
     def get_option(self, name: str, section: str = None) -> BoundOption:
@@ -112,6 +165,38 @@ class Config(BaseConfig):
         super().__init__(options, readers)
         # will automatically set the following section to all newly appended ConfigOptions
         self.section = section
+        # memoized resolution results, keyed by (name, section) and tagged
+        # with the structure version they were computed against
+        self._resolved: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+        self._version = 0
+        # (name, section) -> BoundOption index for O(1) lookups; child
+        # configs merged via __add__ contribute their own bindings
+        self._index: Dict[Tuple[str, str], BaseOption] = {
+            (option.name, option.section): self._bind(option)
+            for option in self._options
+        }
+        # cached reader traversal orders, rebuilt lazily whenever the
+        # structure version moves
+        self._chains_version = -1
+        self._reader_chain: List[BaseConfigReader] = []
+        self._readers_reversed: List[BaseConfig] = []
+        # specialized lookup generated by compile(); ignored once the
+        # structure version moves past the one it was built against
+        self._lookup: Callable = None
+        self._lookup_version = -1
+
+    # options with a hardcoded value never need reader resolution, so the
+    # index can hold them directly and skip the BoundOption wrapper
+    def _bind(self, option: Option) -> BaseOption:
+        if option._value is not None:
+            return option
+        return BoundOption(option, self)
+
+    def _refresh_chains(self):
+        if self._chains_version != self._version:
+            self._reader_chain = [rd for rd in self.readers if isinstance(rd, BaseConfigReader)]
+            self._readers_reversed = list(reversed(self.readers))
+            self._chains_version = self._version
 
     def option(
             self,
@@ -126,14 +211,19 @@ class Config(BaseConfig):
         if section is not None:
             self.section = section
 
-        self._options.add(Option(
+        option = Option(
             name=name,
             default=default,
             value=value,
             processor=processor,
             description=description,
             section=self.section
-        ))
+        )
+        self._options.add(option)
+        # like set.add, an already indexed (name, section) keeps the
+        # original option
+        self._index.setdefault((name, self.section), self._bind(option))
+        self._version += 1
         return self
 
     @property
@@ -141,31 +231,46 @@ class Config(BaseConfig):
         return self._options | set()
 
     def __add__(self, other: BaseConfig):
-        return Config(
+        config = Config(
             options=[],
             readers=[self, other]
         )
+        # merge the operands' indices so lookups on the sum stay O(1);
+        # the right hand side wins, matching the reversed(self.readers)
+        # traversal order in get_option
+        config._index = {
+            **getattr(self, '_index', {}),
+            **getattr(other, '_index', {})
+        }
+        return config
 
     # all children options and readers now belong to this
     def flatten(self):
         options, readers = self.get_flat()
         self._options = options
         self.readers = readers
+        self._index = {
+            (option.name, option.section): self._bind(option)
+            for option in self._options
+        }
+        self._version += 1
 
     def get_option(self, name: str, section: str = None) -> BoundOption:
-        for option in self._options:
-            if option.name == name and option.section == section:
-                return BoundOption(option, self)
-        else:
-            # reverse the readers so that config operations
-            # can work like so:
-            # big_config = defaults + config1 + config2
-            for reader in reversed(self.readers):
-                try:
-                    return reader.get_option(name, section)
-                except UndefinedOptionError:
-                    continue
-            raise UnassignedOptionError(f'Undefined option {name}')
+        try:
+            return self._index[(name, section)]
+        except KeyError:
+            pass
+
+        # reverse the readers so that config operations
+        # can work like so:
+        # big_config = defaults + config1 + config2
+        self._refresh_chains()
+        for reader in self._readers_reversed:
+            try:
+                return reader.get_option(name, section)
+            except UndefinedOptionError:
+                continue
+        raise UnassignedOptionError(f'Undefined option {name}')
 
     # determine the value of an option only using the local readers
     # do not propagate to other BaseConfigs
@@ -174,7 +279,8 @@ class Config(BaseConfig):
             raise ConfigError(f'Reader does not have option {option.name}')
 
         attempts = []
-        for reader in [rd for rd in self.readers if isinstance(rd, BaseConfigReader)]:
+        self._refresh_chains()
+        for reader in self._reader_chain:
             try:
                 return reader.resolve(option)
             except UnassignedOptionError as e:
@@ -185,35 +291,155 @@ class Config(BaseConfig):
 
         raise UnassignedOptionError(f"{option.name} - could not be resolved", attempts)
 
+    # generate a lookup function specialized for the current option set
+    # and reader chain: per (name, section) key the env/ini dict probes
+    # and constant defaults are inlined, removing the generic reader loop
+    # from every access. Call again after structural changes (option(),
+    # flatten(), EnvConfigReader.refresh()) to re-specialize.
+    def compile(self) -> Config:
+        namespace = {'_M': _MISSING, 'UnassignedOptionError': UnassignedOptionError}
+        lines = ['def _lookup(key):']
+        bound_count = 0
+
+        def bind(value) -> str:
+            nonlocal bound_count
+            ref = f'_b{bound_count}'
+            bound_count += 1
+            namespace[ref] = value
+            return ref
+
+        for key, bound in self._index.items():
+            lines.append(f'    if key == {key!r}:')
+
+            if type(bound) is Option:
+                # hardcoded value, inlined as a constant
+                lines.append(f'        return {bind(bound.value)}')
+                continue
+
+            option = bound._option
+            owner = bound._reader
+            owner._refresh_chains()
+            for reader in owner._reader_chain:
+                if isinstance(reader, EnvConfigReader):
+                    if reader._env is None:
+                        reader.refresh()
+                    env_ref = bind(reader._env)
+                    lines.append('        try:')
+                    lines.append(f'            return {env_ref}[{reader._env_name(option.name)!r}]')
+                    lines.append('        except KeyError:')
+                    lines.append('            pass')
+                elif isinstance(reader, IniConfigReader):
+                    name = option.name.lower()
+                    default_checked = False
+                    for section in reader._sections:
+                        section_data = reader._data.get(section)
+                        if section_data is not None:
+                            lines.append(f'        value = {bind(section_data)}.get({name!r}, _M)')
+                            lines.append('        if value is not _M:')
+                            lines.append('            return value')
+                        if not default_checked:
+                            lines.append(f'        value = {bind(reader._data[DEFAULTSECT])}.get({name!r}, _M)')
+                            lines.append('        if value is not _M:')
+                            lines.append('            return value')
+                            default_checked = True
+                else:
+                    # unknown reader type: fall back to a direct resolve call
+                    lines.append('        try:')
+                    lines.append(f'            return {bind(reader)}.resolve({bind(option)})')
+                    lines.append('        except UnassignedOptionError:')
+                    lines.append('            pass')
+
+            if option.default is not None:
+                lines.append(f'        return {bind(option.default)}')
+            else:
+                message = f'{option.name} - could not be resolved'
+                lines.append(f'        raise UnassignedOptionError({message!r}, [])')
+
+        lines.append('    return _M')
+        exec('\n'.join(lines), namespace)
+        self._lookup = namespace['_lookup']
+        self._lookup_version = self._version
+        return self
+
     def __getitem__(self, item: Union[str, Tuple[str, str], Option]) -> Any:
 
-        if not isinstance(item, Option):
+        # exact type dispatch: cheaper than the isinstance/ABC checks it
+        # replaces and this is the hottest entry point of the module
+        item_type = type(item)
+        if item_type is str:
             # look for option in our default section
-            if isinstance(item, str):
-                item = self.get_option(item, self.section)
+            item = self.get_option(item, self.section)
+        elif item_type is tuple:
             # search option in specific section
-            elif isinstance(item, tuple):
-                name, section = item
-                item = self.get_option(name, section)
+            name, section = item
+            item = self.get_option(name, section)
 
+        # hardcoded values win before the memo is even consulted
         if item.value is not None:
             return item.value
 
+        key = (item.name, item.section)
+        cached = self._resolved.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        if self._lookup is not None and self._lookup_version == self._version:
+            try:
+                value = self._lookup(key)
+            except ConfigError as e:
+                LOGGER.error(e)
+                raise
+            if value is not _MISSING:
+                self._resolved[key] = (self._version, value)
+                return value
+
         try:
-            return item.resolve()
+            value = item.resolve()
         except ConfigError as e:
             LOGGER.error(e)
             if item.default is not None:
+                self._resolved[key] = (self._version, item.default)
                 return item.default
             for message in e.attempts:
                 LOGGER.warning(message)
             raise e
 
+        self._resolved[key] = (self._version, value)
+        return value
+
     def cache(self) -> Dict[str, Union[str, bool, int, float]]:
-        output = defaultdict(dict)
-        for option in self.options:
-            output[option.section][option.name] = self[option]
-        return dict(output)
+        options = self.options
+        # preallocate the per-section dicts so the fill loops below are
+        # plain two-level assignments
+        output = {option.section: {} for option in options}
+        pending = {(option.name, option.section): option for option in options}
+
+        # hardcoded values win outright, same as in __getitem__
+        for key, option in list(pending.items()):
+            if option.value is not None:
+                output[option.section][option.name] = option.value
+                del pending[key]
+
+        # one bulk pass per reader instead of a reader walk per option
+        self._refresh_chains()
+        for reader in self._reader_chain:
+            if not pending:
+                break
+            for option, value in reader.resolve_all(pending.values()).items():
+                output[option.section][option.name] = value
+                del pending[(option.name, option.section)]
+
+        for key, option in list(pending.items()):
+            if option.default is not None:
+                output[option.section][option.name] = option.default
+                del pending[key]
+
+        if pending:
+            raise UnassignedOptionError(
+                f"could not resolve options: {', '.join(sorted(name for name, _ in pending))}"
+            )
+
+        return output
 
 
 class ConfigError(Exception):
@@ -239,6 +465,17 @@ class BaseConfigReader(BaseConfig):
     def resolve(self, option: Option) -> Any:
         pass
 
+    # resolve a whole batch of options in one pass, skipping the ones this
+    # reader does not know about; subclasses override with bulk lookups
+    def resolve_all(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        resolved = {}
+        for option in options:
+            try:
+                resolved[option] = self.resolve(option)
+            except UnassignedOptionError:
+                continue
+        return resolved
+
     @property
     def options(self) -> Set[Option]:
         return set()
@@ -247,28 +484,70 @@ class BaseConfigReader(BaseConfig):
 class EnvConfigReader(BaseConfigReader):
 
     def resolve(self, option: BaseOption):
+        if self._env is None:
+            self.refresh()
+        env_name = self._env_name(option.name)
         try:
-            return os.environ[self._env_name(option.name)]
+            return self._env[env_name]
         except KeyError:
             raise UnassignedOptionError(attempts=[
-                f'{self.__class__.__name__} | searching for {option.name} | could not find {self._env_name(
-                    option.name)}'
+                f'{self.__class__.__name__} | searching for {option.name} | could not find {env_name}'
             ])
 
-    def __init__(self, prefix=None):
+    def __init__(self, prefix=None, lazy=False):
         super().__init__()
-        self._prefix = prefix or ''
+        # uppercased once here so cache misses in _env_name only have to
+        # uppercase the option name itself
+        self._prefix = (prefix or '').upper()
+        self._name_cache: Dict[str, str] = {}
+        # the environment is snapshotted into a plain dict to skip the
+        # os.environ wrapper on every resolve; pass lazy=True to defer the
+        # snapshot to the first resolve call
+        self._env = None if lazy else dict(os.environ)
+
+    # re-snapshot the environment; only needed by long running processes
+    # that mutate os.environ after the reader was built
+    def refresh(self):
+        self._env = dict(os.environ)
+
+    def resolve_all(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        if self._env is None:
+            self.refresh()
+        env = self._env
+        resolved = {}
+        for option in options:
+            value = env.get(self._env_name(option.name), _MISSING)
+            if value is not _MISSING:
+                resolved[option] = value
+        return resolved
 
     def _env_name(self, name: str) -> str:
-        return (self._prefix + name).upper()
+        return self._name_cache.get(name) or self._name_cache.setdefault(name, self._prefix + name.upper())
 
 
 class IniConfigReader(BaseConfigReader):
-    def __init__(self, filepath: str, section: str = None, sections: List[str] = None):
+    def __init__(self, filepath: str, section: str = None, sections: List[str] = None, strict: bool = False):
         super().__init__()
-        with open(filepath, 'rt') as f:
+        if strict:
+            # full configparser semantics (interpolation, continuations),
+            # flattened into plain dicts so resolution never goes through
+            # the SectionProxy / interpolation chain again. The file is
+            # slurped first so the descriptor is released before parsing
+            with open(filepath, 'rb') as f:
+                raw = f.read()
             self._config = configparser.ConfigParser()
-            self._config.read_file(f)
+            self._config.read_string(raw.decode('utf-8'))
+            self._data = {DEFAULTSECT: dict(self._config.defaults())}
+            for found_section in self._config.sections():
+                self._data[found_section] = dict(self._config[found_section])
+        else:
+            stat = os.stat(filepath)
+            cache_key = (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns)
+            parser = _INI_CACHE.get(cache_key)
+            if parser is None:
+                parser = _INI_CACHE[cache_key] = FastConfigParser.from_file(filepath)
+            self._config = parser
+            self._data = parser.data
 
         if sections is not None:
             self._sections = sections
@@ -278,13 +557,40 @@ class IniConfigReader(BaseConfigReader):
             raise ConfigError('Need to configure ONLY one of "section" or "sections"')
 
     def resolve(self, option: Option):
+        # plain dict lookups with the same DEFAULT fallback configparser
+        # applies per section
         attempts = []
+        name = option.name.lower()
+        default = self._data[DEFAULTSECT]
         for section in self._sections:
-            try:
-                return self._config[section][option.name]
-            except KeyError:
-                attempts.append(
-                    f'{self.__class__.__name__} | searching for {option.name} | not found in section {section}'
-                )
-        else:
-            raise UnassignedOptionError(attempts=attempts)
+            section_data = self._data.get(section)
+            if section_data is not None:
+                value = section_data.get(name, _MISSING)
+                if value is not _MISSING:
+                    return value
+            value = default.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+            attempts.append(
+                f'{self.__class__.__name__} | searching for {option.name} | not found in section {section}'
+            )
+        raise UnassignedOptionError(attempts=attempts)
+
+    def resolve_all(self, options: Iterable[Option]) -> Dict[Option, Any]:
+        wanted = {option.name.lower(): option for option in options}
+        resolved = {}
+        default = self._data[DEFAULTSECT]
+        for section in self._sections:
+            if not wanted:
+                break
+            section_data = self._data.get(section)
+            for name in list(wanted):
+                if section_data is not None:
+                    value = section_data.get(name, _MISSING)
+                    if value is not _MISSING:
+                        resolved[wanted.pop(name)] = value
+                        continue
+                value = default.get(name, _MISSING)
+                if value is not _MISSING:
+                    resolved[wanted.pop(name)] = value
+        return resolved
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import mmap
+import re
+from typing import Dict, List
+
+DEFAULTSECT = 'DEFAULT'
+
+_SECTION = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_KV = re.compile(r'^\s*([^=:;#\s][^=:]*?)\s*[:=]\s*(.*?)\s*$')
+
+
+class FastConfigParser:
+    """Minimal regex based INI parser.
+
+    Covers only the subset of configparser behaviour that IniConfigReader
+    relies on: '[section]' headers, 'key = value' / 'key: value' pairs,
+    comment and blank line skipping, lowercased option names and a DEFAULT
+    section that collects keys appearing before the first header. There is
+    no interpolation and no line continuation support - use configparser
+    directly if those are needed.
+    """
+
+    def __init__(self, text: str = None):
+        self._data: Dict[str, Dict[str, str]] = {DEFAULTSECT: {}}
+        if text is not None:
+            self.read_string(text)
+
+    def read_string(self, text: str):
+        current = self._data[DEFAULTSECT]
+        for line in text.splitlines():
+            match = _SECTION.match(line)
+            if match:
+                current = self._data.setdefault(match.group(1).strip(), {})
+                continue
+            match = _KV.match(line)
+            if match:
+                current[match.group(1).lower()] = match.group(2)
+
+    @classmethod
+    def from_file(cls, filepath: str) -> FastConfigParser:
+        """Parse a file through mmap, decoding only section names, keys and
+        values instead of the whole file."""
+        parser = cls()
+        with open(filepath, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty file or mmap-hostile filesystem
+                parser.read_string(f.read().decode('utf-8'))
+                return parser
+        try:
+            parser._read_buffer(buffer)
+        finally:
+            buffer.close()
+        return parser
+
+    def _read_buffer(self, buffer):
+        # byte level equivalent of read_string: split on b'\n' via find,
+        # classify each line by its first non-blank byte and decode only
+        # the slices that end up as dict keys/values
+        current = self._data[DEFAULTSECT]
+        find = buffer.find
+        size = len(buffer)
+        pos = 0
+        while pos < size:
+            end = find(b'\n', pos)
+            if end == -1:
+                end = size
+            next_pos = end + 1
+
+            start = pos
+            while start < end and buffer[start] in b' \t\r':
+                start += 1
+            if start == end:
+                pos = next_pos
+                continue
+
+            first = buffer[start]
+            if first in b';#':
+                pos = next_pos
+                continue
+
+            line_end = end
+            while line_end > start and buffer[line_end - 1] in b' \t\r':
+                line_end -= 1
+
+            if first == 0x5b:  # '['
+                closing = find(b']', start, line_end)
+                if closing == line_end - 1 and closing > start + 1:
+                    section = buffer[start + 1:closing].decode('utf-8').strip()
+                    current = self._data.setdefault(section, {})
+                pos = next_pos
+                continue
+
+            if first not in b'=:':
+                eq = find(b'=', start, line_end)
+                colon = find(b':', start, line_end)
+                if eq == -1:
+                    sep = colon
+                elif colon == -1:
+                    sep = eq
+                else:
+                    sep = min(eq, colon)
+                if sep != -1:
+                    key = buffer[start:sep].rstrip().decode('utf-8').lower()
+                    current[key] = buffer[sep + 1:line_end].strip().decode('utf-8')
+
+            pos = next_pos
+
+    def sections(self) -> List[str]:
+        return [section for section in self._data if section != DEFAULTSECT]
+
+    def defaults(self) -> Dict[str, str]:
+        return self._data[DEFAULTSECT]
+
+    @property
+    def data(self) -> Dict[str, Dict[str, str]]:
+        return self._data
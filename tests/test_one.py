@@ -173,10 +173,134 @@ def test_cache():
     config.section = "OTHER"
     config.option('option4', 'yes')
 
-    # cache = config.cache()
-    # assert cache == {}
+    cache = config.cache()
+    assert cache['OTHER'] == {'option4': 'yes'}
+    assert cache[None]['option1'] == 1
+    assert cache[None]['ForwardX11'] == 'yes'
+    assert cache[None]['Port'] == '50022'
+    assert cache[None]['User'] == 'EnvironUser'
+
+    # options that resolve nowhere make cache() fail loudly
+    config.option('missing')
+    with pytest.raises(UnassignedOptionError):
+        config.cache()
+
+def test_falsy_values():
+    config = Config(options=[
+        Option('empty', value=''),
+        Option('zero', value=0, processor=int),
+        Option('off', False),
+    ])
+
+    # falsy values and defaults must not be mistaken for "unset"
+    assert config['empty'] == ''
+    assert config['zero'] == 0
+    assert config['off'] is False
+
+
+def test_env_reader_snapshot():
+    os.environ['OPTION7'] = 'old'
+    reader = EnvConfigReader()
+
+    os.environ['OPTION7'] = 'new'
+    # the reader works off the snapshot taken at construction time
+    assert reader.resolve(Option('option7')) == 'old'
+
+    reader.refresh()
+    assert reader.resolve(Option('option7')) == 'new'
+
+    # a lazy reader snapshots on first resolve instead
+    lazy = EnvConfigReader(lazy=True)
+    os.environ['OPTION7'] = 'newer'
+    assert lazy.resolve(Option('option7')) == 'newer'
+
+
+def test_memoized_getitem():
+    os.environ['OPTION3'] = 'spam'
+
+    config = Config(options=[Option('option3')], readers=[EnvConfigReader()])
+    assert config['option3'] == 'spam'
+
+    # repeated accesses are served from the memo
+    config._resolved[('option3', None)] = (config._version, 'memoized')
+    assert config['option3'] == 'memoized'
+
+    # structural changes bump the version and stale entries are ignored
+    config.option('other', 1)
+    assert config['option3'] == 'spam'
+
 
 def test_ini_reader():
     reader = IniConfigReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'])
     assert reader._config.sections() == ['bitbucket.org', 'topsecret.server.com']
 
+
+def test_compile():
+    os.environ['OPTION3'] = 'spam'
+
+    config = Config(
+        options=[
+            Option('option1', 1),
+            Option('option2', value=2, processor=int),
+            Option('option3'),
+            Option('Port'),
+        ],
+        readers=[
+            EnvConfigReader(),
+            IniConfigReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'])
+        ]
+    )
+    config.compile()
+
+    assert config['option1'] == 1
+    assert config['option2'] == 2
+    assert config['option3'] == 'spam'
+    assert config['Port'] == '50022'
+
+    # structural changes sideline the compiled lookup until recompiled
+    config.option('option9', 9)
+    assert config['option9'] == 9
+    config.compile()
+    assert config['option9'] == 9
+
+
+def test_fast_parser_from_file(tmp_path):
+    from config_utils._fastini import FastConfigParser
+
+    ini = tmp_path / 'sample.ini'
+    ini.write_text('top = 1\n; comment\n# another\n[sec]\nkey: value\nSpaced  =  v \n')
+
+    parser = FastConfigParser.from_file(str(ini))
+    assert parser.defaults() == {'top': '1'}
+    assert parser.data['sec'] == {'key': 'value', 'spaced': 'v'}
+
+    # the mmap path falls back gracefully for empty files
+    empty = tmp_path / 'empty.ini'
+    empty.write_text('')
+    assert FastConfigParser.from_file(str(empty)).sections() == []
+
+
+def test_ini_reader_shared_parse(tmp_path):
+    # readers of the same unchanged file share one parsed state
+    reader1 = IniConfigReader('tests/config.ini', section='bitbucket.org')
+    reader2 = IniConfigReader('tests/config.ini', section='topsecret.server.com')
+    assert reader1._config is reader2._config
+
+    # an edited file is re-parsed
+    ini = tmp_path / 'changing.ini'
+    ini.write_text('[sec]\nkey = 1\n')
+    before = IniConfigReader(str(ini), section='sec')
+    ini.write_text('[sec]\nkey = 22\n')
+    after = IniConfigReader(str(ini), section='sec')
+    assert before.resolve(Option('key')) == '1'
+    assert after.resolve(Option('key')) == '22'
+
+
+def test_ini_reader_strict():
+    # the configparser backed path should resolve exactly like the fast one
+    fast = IniConfigReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'])
+    strict = IniConfigReader('tests/config.ini', sections=['bitbucket.org', 'topsecret.server.com'], strict=True)
+
+    for name in ['User', 'ForwardX11', 'Port', 'CompressionLevel']:
+        assert fast.resolve(Option(name)) == strict.resolve(Option(name))
+